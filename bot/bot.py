@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
 import logging
-from typing import override
+from typing import TYPE_CHECKING, override
 
 from discord import Intents
 from discord.ext import commands
@@ -10,8 +12,13 @@ from discord.ext import commands
 from bot.translator import Translator
 from utils.db import close_db, init_db
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 logger = logging.getLogger(__name__)
 
+COG_LOAD_TIMEOUT_SECONDS = 30.0
+
 
 class Rhoboto(commands.Bot):
     """
@@ -22,7 +29,12 @@ class Rhoboto(commands.Bot):
     """
 
     def __init__(
-        self, *, command_prefix: str, db_url: str, initial_cogs: list[str]
+        self,
+        *,
+        command_prefix: str,
+        db_url: str,
+        initial_cogs: list[str],
+        command_sync_digest_path: Path | None = None,
     ) -> None:
         """
         Initializes the Rhoboto bot.
@@ -31,9 +43,13 @@ class Rhoboto(commands.Bot):
             command_prefix (str): The bot's command prefix.
             db_url (str): Database connection URL for Tortoise ORM.
             initial_cogs (list[str]): List of initial cogs module names to load.
+            command_sync_digest_path (Path | None): File storing the digest of the
+                last synced command tree. When omitted, commands sync on every
+                startup.
         """
         self.initial_cogs = initial_cogs
         self.db_url = db_url
+        self.command_sync_digest_path = command_sync_digest_path
         intents = Intents.default()
         intents.members = True
         intents.message_content = True
@@ -58,16 +74,84 @@ class Rhoboto(commands.Bot):
     async def setup_hook(self) -> None:
         """
         Called by Discord.py when the bot is starting up.
-        Loads all initial cogs and initializes the database, then syncs slash commands.
+        Initializes the database before loading the initial cogs, so cog setup
+        never races Tortoise connection creation, then syncs slash commands
+        when the command tree changed since the last recorded sync.
+        A cog that fails or times out is logged and skipped so the remaining
+        cogs still start.
         """
-        await asyncio.gather(
-            init_db(self.db_url),
-            *(self.load_extension(name) for name in self.initial_cogs),
-        )
+        await init_db(self.db_url)
+        await self._load_initial_cogs()
         self._register_persistent_views()
         await self.tree.set_translator(Translator())
+        await self._sync_commands_if_changed()
+
+    async def _load_initial_cogs(self) -> None:
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(
+                    self.load_extension(name),
+                    timeout=COG_LOAD_TIMEOUT_SECONDS,
+                )
+                for name in self.initial_cogs
+            ),
+            return_exceptions=True,
+        )
+        for name, result in zip(self.initial_cogs, results, strict=True):
+            if isinstance(result, TimeoutError):
+                logger.error(
+                    "Timed out loading cog `%s` after %s seconds; skipped.",
+                    name,
+                    COG_LOAD_TIMEOUT_SECONDS,
+                )
+            elif isinstance(result, Exception):
+                # load_extension already logged the traceback.
+                logger.error("Skipped cog `%s` after a load failure.", name)
+            elif isinstance(result, BaseException):
+                raise result
+
+    async def _sync_commands_if_changed(self) -> None:
+        digest_path = self.command_sync_digest_path
+        if digest_path is None:
+            await self.tree.sync()
+            logger.info("Slash commands synced.")
+            return
+
+        digest = await self._command_tree_digest()
+        try:
+            synced_digest = digest_path.read_text(encoding="utf-8").strip()
+        except OSError:
+            synced_digest = None
+        if synced_digest == digest:
+            logger.info("Slash commands unchanged; skipped sync.")
+            return
+
         await self.tree.sync()
         logger.info("Slash commands synced.")
+        try:
+            digest_path.parent.mkdir(parents=True, exist_ok=True)
+            digest_path.write_text(digest, encoding="utf-8")
+        except OSError:
+            logger.warning(
+                "Failed to record slash command sync digest at `%s`.", digest_path
+            )
+
+    async def _command_tree_digest(self) -> str:
+        """Return a stable digest of the global command payload sent by sync."""
+        translator = self.tree.translator
+        payload = [
+            await command.get_translated_payload(self.tree, translator)
+            if translator is not None
+            else command.to_dict(self.tree)
+            for command in self.tree.get_commands()
+        ]
+        payload.sort(key=lambda item: (item.get("type", 1), item["name"]))
+        encoded = json.dumps(
+            {"application_id": self.application_id, "commands": payload},
+            sort_keys=True,
+            ensure_ascii=False,
+        ).encode()
+        return hashlib.md5(encoded, usedforsecurity=False).hexdigest()
 
     def _register_persistent_views(self) -> None:
         for cog in self.cogs.values():
@@ -1,30 +1,57 @@
+from __future__ import annotations
+
 import os
+from dataclasses import dataclass
 
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
+@dataclass(frozen=True, slots=True)
 class Config:
     """Configuration loader for Rhoboto Discord bot."""
 
-    DISCORD_TOKEN = os.getenv("DISCORD_TOKEN", "")
-    COMMAND_PREFIX = os.getenv("COMMAND_PREFIX", "$")
-    BOT_ENV = os.getenv("BOT_ENV", "dev").lower()
-    LOG_TO_FILE = os.getenv("LOG_TO_FILE", "False").lower() == "true"
-    USE_RICH_LOGGING = os.getenv("USE_RICH_LOGGING", "True").lower() == "true"
-    LOG_DIR = os.getenv("LOG_DIR", "data/logs")
-    LOG_FILENAME = os.getenv("LOG_FILENAME", "rhoboto.log")
-    LOG_LEVEL = os.getenv("LOG_LEVEL", "DEBUG" if BOT_ENV == "dev" else "INFO").upper()
-    DATABASE_URL = os.getenv("DATABASE_URL", "sqlite://data/db.sqlite3")
-    GOOGLE_SERVICE_ACCOUNT_PATH = os.getenv(
-        "GOOGLE_SERVICE_ACCOUNT_PATH", "secrets/service_account.json"
-    )
-
-    DEFAULT_EMBED_COLOR = 0x99CCFF
-    WARNING_EMOJI = "⚠️"
-    PROCESSING_EMOJI = "<a:haruka_math:1402204882492063825>"
-    CONFUSED_EMOJI = "<:haruka_confused:1402850801608556574>"
+    DISCORD_TOKEN: str
+    COMMAND_PREFIX: str
+    BOT_ENV: str
+    LOG_TO_FILE: bool
+    USE_RICH_LOGGING: bool
+    LOG_DIR: str
+    LOG_FILENAME: str
+    LOG_LEVEL: str
+    DATABASE_URL: str
+    GOOGLE_SERVICE_ACCOUNT_PATH: str
+    COMMAND_SYNC_DIGEST_PATH: str
+
+    DEFAULT_EMBED_COLOR: int = 0x99CCFF
+    WARNING_EMOJI: str = "⚠️"
+    PROCESSING_EMOJI: str = "<a:haruka_math:1402204882492063825>"
+    CONFUSED_EMOJI: str = "<:haruka_confused:1402850801608556574>"
+
+    @classmethod
+    def from_env(cls) -> Config:
+        """Read every environment-backed setting once."""
+        bot_env = os.getenv("BOT_ENV", "dev").lower()
+        return cls(
+            DISCORD_TOKEN=os.getenv("DISCORD_TOKEN", ""),
+            COMMAND_PREFIX=os.getenv("COMMAND_PREFIX", "$"),
+            BOT_ENV=bot_env,
+            LOG_TO_FILE=os.getenv("LOG_TO_FILE", "False").lower() == "true",
+            USE_RICH_LOGGING=os.getenv("USE_RICH_LOGGING", "True").lower() == "true",
+            LOG_DIR=os.getenv("LOG_DIR", "data/logs"),
+            LOG_FILENAME=os.getenv("LOG_FILENAME", "rhoboto.log"),
+            LOG_LEVEL=os.getenv(
+                "LOG_LEVEL", "DEBUG" if bot_env == "dev" else "INFO"
+            ).upper(),
+            DATABASE_URL=os.getenv("DATABASE_URL", "sqlite://data/db.sqlite3"),
+            GOOGLE_SERVICE_ACCOUNT_PATH=os.getenv(
+                "GOOGLE_SERVICE_ACCOUNT_PATH", "secrets/service_account.json"
+            ),
+            COMMAND_SYNC_DIGEST_PATH=os.getenv(
+                "COMMAND_SYNC_DIGEST_PATH", "data/.cmd_sync_hash"
+            ),
+        )
 
     def validate_runtime(self) -> None:
         """Validate settings required to start the bot process."""
@@ -33,4 +60,4 @@ class Config:
             raise ValueError(error_message)
 
 
-config = Config()
+config = Config.from_env()
@@ -11,6 +11,7 @@ from cogs.base.discord_context import require_guild_channel_source
 from components.ui_feature_channel import DisableAndClearConfirmView
 from components.ui_storage_errors import send_storage_error
 from models.feature_channel import FeatureChannel
+from utils.feature_channel_cache import feature_enabled_cache
 from utils.register_i18n import register_user_text
 from utils.storage_errors import (
     StorageError,
@@ -240,6 +241,20 @@ class FeatureChannelBase(
             require_enabled=True,
         )
 
+    @classmethod
+    async def _has_enabled_feature_channel(
+        cls,
+        guild_id: int,
+        channel_id: int,
+        feature_name: str | None = None,
+    ) -> bool:
+        return await FeatureChannel.filter(
+            guild_id=guild_id,
+            channel_id=channel_id,
+            feature_name=feature_name or cls.feature_name,
+            is_enabled=True,
+        ).exists()
+
     @app_commands.command(
         name="enable",
         description="Enable this feature in the current channel.",
@@ -432,6 +447,7 @@ class FeatureChannelBase(
             channel_id=channel_id,
             feature_name=self.feature_name,
         ).delete()
+        feature_enabled_cache.invalidate(guild_id, channel_id, self.feature_name)
         self.logger.info(
             "Cleared %d feature settings for Feature: `%s` in Guild: `%s` "
             "Channel: `%s`",
@@ -448,14 +464,13 @@ class FeatureChannelBase(
         channel_id: int,
         feature_name: str | None = None,
     ) -> bool:
-        return (
-            await cls._get_enabled_feature_channel_or_none(
-                guild_id,
-                channel_id,
-                feature_name,
-            )
-            is not None
-        )
+        """Return whether the feature is enabled, using the short-lived cache."""
+        key = (guild_id, channel_id, feature_name or cls.feature_name)
+        enabled = feature_enabled_cache.get(key)
+        if enabled is None:
+            enabled = await cls._has_enabled_feature_channel(*key)
+            feature_enabled_cache.set(key, enabled=enabled)
+        return enabled
 
     @staticmethod
     def feature_enabled_prefix_command_predicate(
@@ -11,6 +11,7 @@ from discord.ext import commands
 from bot import config
 from cogs.base.discord_context import require_guild_channel_source
 from cogs.base.feature_channel_base import FeatureChannelBase
+from utils.feature_channel_cache import feature_enabled_cache
 from utils.reactions import add_reaction_if_possible
 from utils.storage_errors import classify_storage_exception, generate_error_reference
 from utils.structs_base import SubmissionParseResult, UserInfo
@@ -227,11 +228,13 @@ class MessageUpsertFeatureChannelBase[
     ) -> MessageContextT | None:
         if message.author.bot or message.guild is None or message.channel is None:
             return None
-        membership = await self._get_enabled_feature_channel_or_none(
-            message.guild.id,
-            message.channel.id,
-            self.feature_name,
-        )
+        # Most messages arrive in channels without this feature; remembering
+        # the miss keeps them from querying the membership on every message.
+        key = (message.guild.id, message.channel.id, self.feature_name)
+        if feature_enabled_cache.get(key) is False:
+            return None
+        membership = await self._get_enabled_feature_channel_or_none(*key)
+        feature_enabled_cache.set(key, enabled=membership is not None)
         if membership is None:
             return None
         return self._build_message_context(membership)
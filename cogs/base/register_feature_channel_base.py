@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from abc import abstractmethod
 from typing import TYPE_CHECKING, ClassVar, Protocol, override, runtime_checkable
 
@@ -892,29 +893,37 @@ class RegisterFeatureChannelBase[
             )
             return
 
-        anchor_saved = False
-        for announcement in announcements:
-            message = await interaction.followup.send(
-                announcement.content,
-                ephemeral=False,
-                wait=True,
-            )
-            if anchor_saved:
-                continue
-            anchor_saved = True
-            try:
-                await save_manual_guide_anchor(context.feature_channel, message.id)
-            except Exception:  # noqa: BLE001
-                self.logger.warning(
-                    (
-                        "Failed to save manual guide anchor for Feature: `%s` in "
-                        "Guild: `%s` Channel: `%s` MessageKind: `%s` "
-                        "Message: `%s`"
-                    ),
-                    self.feature_name,
-                    context.guild_id,
-                    context.channel_id,
-                    FeatureChannelMessageKind.MANUAL_GUIDE.value,
-                    message.id,
-                    exc_info=True,
+        # Announcements must keep their language order, so sends stay sequential;
+        # only the anchor write overlaps with the remaining sends.
+        anchor_save: asyncio.Task[object] | None = None
+        anchor_message_id: int | None = None
+        try:
+            for announcement in announcements:
+                message = await interaction.followup.send(
+                    announcement.content,
+                    ephemeral=False,
+                    wait=True,
                 )
+                if anchor_save is None:
+                    anchor_message_id = message.id
+                    anchor_save = asyncio.create_task(
+                        save_manual_guide_anchor(context.feature_channel, message.id)
+                    )
+        finally:
+            if anchor_save is not None:
+                try:
+                    await anchor_save
+                except Exception:  # noqa: BLE001
+                    self.logger.warning(
+                        (
+                            "Failed to save manual guide anchor for Feature: `%s` in "
+                            "Guild: `%s` Channel: `%s` MessageKind: `%s` "
+                            "Message: `%s`"
+                        ),
+                        self.feature_name,
+                        context.guild_id,
+                        context.channel_id,
+                        FeatureChannelMessageKind.MANUAL_GUIDE.value,
+                        anchor_message_id,
+                        exc_info=True,
+                    )
@@ -5,6 +5,9 @@ from bot import Rhoboto, config
 from cogs.base.discord_context import require_guild_channel_source
 from models.feature_channel import FeatureChannel
 
+_STATUS_ENABLED = r"\🟢 enabled"
+_STATUS_DISABLED = r"\⚫ disabled"
+
 
 class Features(commands.Cog):
     """Query all enabled features in this channel."""
@@ -21,18 +24,18 @@ class Features(commands.Cog):
         feature_channel = await FeatureChannel.filter(
             guild_id=source.guild.id,
             channel_id=source.channel.id,
-        ).all()
+        ).only("feature_name", "is_enabled")
         embed = Embed(
             title="Features in This Channel", color=config.DEFAULT_EMBED_COLOR
         )
-        if feature_channel:
-            lines = []
-            for f in feature_channel:
-                status = r"\🟢 enabled" if f.is_enabled else r"\⚫ disabled"
-                lines.append(f"- `{f.feature_name}`: {status}")
-            embed.description = "\n".join(lines)
-        else:
-            embed.description = "No features are registered in this channel."
+        embed.description = (
+            "\n".join(
+                f"- `{f.feature_name}`: "
+                f"{_STATUS_ENABLED if f.is_enabled else _STATUS_DISABLED}"
+                for f in feature_channel
+            )
+            or "No features are registered in this channel."
+        )
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
 
@@ -52,6 +52,7 @@ from components.ui_settings_flow import (
 from components.ui_storage_errors import send_storage_error
 from models.feature_channel import FeatureChannel
 from models.room_number import RoomNumberConfig
+from utils.feature_channel_cache import feature_enabled_cache
 from utils.key_async_lock import KeyAsyncLock
 from utils.reactions import (
     add_reaction_if_possible,
@@ -701,6 +702,7 @@ class RoomNumber(
                         .using_db(connection)
                         .delete()
                     )
+            feature_enabled_cache.invalidate(guild_id, feature_name=self.feature_name)
             self._delivery_generations[source_channel_id] = (
                 self._delivery_generations.get(source_channel_id, 0) + 1
             )
@@ -1351,6 +1353,7 @@ class RoomNumber(
                             .using_db(connection)
                             .delete()
                         )
+            feature_enabled_cache.invalidate(guild_id, feature_name=self.feature_name)
             self._delivery_generations.pop(state_channel_id, None)
 
     @override
@@ -30,6 +30,7 @@ bot = Rhoboto(
     command_prefix=config.COMMAND_PREFIX,
     db_url=config.DATABASE_URL,
     initial_cogs=get_cogs_modules(),
+    command_sync_digest_path=Path(config.COMMAND_SYNC_DIGEST_PATH),
 )
 
 try:
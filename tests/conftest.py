@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from utils.feature_channel_cache import feature_enabled_cache
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@pytest.fixture(autouse=True)
+def clear_feature_enabled_cache() -> Iterator[None]:
+    feature_enabled_cache.clear()
+    yield
+    feature_enabled_cache.clear()
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+import dataclasses
 import importlib
+from dataclasses import replace
 from typing import TYPE_CHECKING
 
 import pytest
@@ -10,6 +13,7 @@ from bot.bot import Rhoboto
 from bot.config import Config
 
 if TYPE_CHECKING:
+    from pathlib import Path
     from types import ModuleType
 
 
@@ -27,8 +31,7 @@ def _reload_config_without_dotenv(monkeypatch: pytest.MonkeyPatch) -> ModuleType
 
 
 def test_config_runtime_validation_is_explicit() -> None:
-    config = Config()
-    config.DISCORD_TOKEN = ""
+    config = replace(Config.from_env(), DISCORD_TOKEN="")
 
     with pytest.raises(ValueError, match="DISCORD_TOKEN is required"):
         config.validate_runtime()
@@ -82,6 +85,13 @@ def test_google_service_account_path_can_be_configured_from_environment(
     _reload_config_module()
 
 
+def test_config_is_frozen() -> None:
+    config = Config.from_env()
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.DISCORD_TOKEN = "changed"  # type: ignore[misc]  # noqa: S105
+
+
 @pytest.mark.asyncio
 async def test_load_extension_re_raises_startup_failures(
     monkeypatch: pytest.MonkeyPatch,
@@ -209,3 +219,97 @@ async def test_setup_hook_registers_persistent_views_after_loading_cogs(
         "super.close",
         "close_db",
     ]
+
+
+@pytest.mark.asyncio
+async def test_command_sync_records_digest_and_skips_unchanged_tree(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    sync_calls: list[str] = []
+
+    async def fake_sync() -> None:
+        sync_calls.append("sync")
+
+    async def fake_bot_close(_self: commands.Bot) -> None:
+        return None
+
+    async def fake_close_db(_db_url: str) -> None:
+        return None
+
+    digest_path = tmp_path / "data" / ".cmd_sync_hash"
+    bot = Rhoboto(
+        command_prefix="$",
+        db_url="sqlite://:memory:",
+        initial_cogs=[],
+        command_sync_digest_path=digest_path,
+    )
+    monkeypatch.setattr("bot.bot.close_db", fake_close_db)
+    monkeypatch.setattr(commands.Bot, "close", fake_bot_close)
+    bot.tree.sync = fake_sync
+
+    try:
+        await bot._sync_commands_if_changed()  # noqa: SLF001
+        recorded_digest = digest_path.read_text(encoding="utf-8")
+        await bot._sync_commands_if_changed()  # noqa: SLF001
+
+        @bot.tree.command(name="ping", description="Ping.")
+        async def ping(_interaction: object) -> None:
+            return None
+
+        await bot._sync_commands_if_changed()  # noqa: SLF001
+    finally:
+        await bot.close()
+
+    assert sync_calls == ["sync", "sync"]
+    assert digest_path.read_text(encoding="utf-8") != recorded_digest
+
+
+@pytest.mark.asyncio
+async def test_setup_hook_skips_failed_and_hanging_cogs(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    loaded: list[str] = []
+
+    async def fake_init_db(_db_url: str) -> None:
+        return None
+
+    async def fake_close_db(_db_url: str) -> None:
+        return None
+
+    async def fake_bot_close(_self: commands.Bot) -> None:
+        return None
+
+    async def fake_load_extension(name: str) -> None:
+        if name == "cogs.broken":
+            msg = "boom"
+            raise RuntimeError(msg)
+        if name == "cogs.hanging":
+            await asyncio.Event().wait()
+        loaded.append(name)
+
+    async def fake_set_translator(_translator: object) -> None:
+        return None
+
+    async def fake_sync() -> None:
+        return None
+
+    bot = Rhoboto(
+        command_prefix="$",
+        db_url="sqlite://:memory:",
+        initial_cogs=["cogs.broken", "cogs.hanging", "cogs.ok"],
+    )
+    monkeypatch.setattr("bot.bot.COG_LOAD_TIMEOUT_SECONDS", 0.01)
+    monkeypatch.setattr("bot.bot.init_db", fake_init_db)
+    monkeypatch.setattr("bot.bot.close_db", fake_close_db)
+    monkeypatch.setattr(commands.Bot, "close", fake_bot_close)
+    bot.load_extension = fake_load_extension
+    bot.tree.set_translator = fake_set_translator
+    bot.tree.sync = fake_sync
+
+    try:
+        await bot.setup_hook()
+    finally:
+        await bot.close()
+
+    assert loaded == ["cogs.ok"]
@@ -841,6 +841,29 @@ async def test_init_db_enables_global_fallback_for_cross_task_queries(
     await init_db("postgres://example.invalid/rhoboto")
 
     assert init_kwargs["_enable_global_fallback"] is True
+    assert init_kwargs["db_url"] == (
+        "postgres://example.invalid/rhoboto?minsize=5&maxsize=20"
+    )
+
+
+@pytest.mark.asyncio
+async def test_init_db_keeps_explicit_pool_sizes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    db_urls: list[object] = []
+
+    async def fake_init(*_args: object, **kwargs: object) -> None:
+        db_urls.append(kwargs["db_url"])
+
+    async def fake_generate_schemas() -> None:
+        return None
+
+    monkeypatch.setattr(Tortoise, "init", fake_init)
+    monkeypatch.setattr(Tortoise, "generate_schemas", fake_generate_schemas)
+
+    await init_db("postgres://example.invalid/rhoboto?maxsize=50")
+
+    assert db_urls == ["postgres://example.invalid/rhoboto?maxsize=50&minsize=5"]
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from cogs.base.feature_channel_base import FeatureChannelBase
+from models.feature_channel import FeatureChannel
+from utils.db import close_db, init_db
+from utils.feature_channel_cache import FeatureEnabledCache, feature_enabled_cache
+
+
+async def _start_db() -> str:
+    db_url = "sqlite://:memory:"
+    await asyncio.wait_for(init_db(db_url), timeout=3)
+    return db_url
+
+
+def test_cache_entries_expire_after_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = 100.0
+    monkeypatch.setattr("utils.feature_channel_cache.time.monotonic", lambda: now)
+    cache = FeatureEnabledCache(ttl=60.0)
+
+    cache.set((1, 2, "team_register"), enabled=True)
+    assert cache.get((1, 2, "team_register")) is True
+
+    now = 160.0
+    assert cache.get((1, 2, "team_register")) is None
+
+
+def test_cache_invalidates_matching_guild_entries() -> None:
+    cache = FeatureEnabledCache()
+    cache.set((1, 2, "team_register"), enabled=True)
+    cache.set((1, 2, "shift_register"), enabled=True)
+    cache.set((1, 3, "team_register"), enabled=False)
+    cache.set((9, 2, "team_register"), enabled=True)
+
+    cache.invalidate(1, feature_name="team_register")
+
+    assert cache.get((1, 2, "team_register")) is None
+    assert cache.get((1, 3, "team_register")) is None
+    assert cache.get((1, 2, "shift_register")) is True
+    assert cache.get((9, 2, "team_register")) is True
+
+    cache.invalidate(1, 2)
+
+    assert cache.get((1, 2, "shift_register")) is None
+    assert cache.get((9, 2, "team_register")) is True
+
+
+@pytest.mark.asyncio
+async def test_is_enabled_reuses_cached_state_until_membership_saves(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    db_url = await _start_db()
+    lookups: list[tuple[int, int, str | None]] = []
+    original_lookup = FeatureChannelBase._has_enabled_feature_channel.__func__  # noqa: SLF001
+
+    async def counting_lookup(
+        cls: type[FeatureChannelBase],
+        guild_id: int,
+        channel_id: int,
+        feature_name: str | None = None,
+    ) -> bool:
+        lookups.append((guild_id, channel_id, feature_name))
+        return await original_lookup(cls, guild_id, channel_id, feature_name)
+
+    monkeypatch.setattr(
+        FeatureChannelBase,
+        "_has_enabled_feature_channel",
+        classmethod(counting_lookup),
+    )
+    try:
+        membership = await FeatureChannel.create(
+            guild_id=1,
+            channel_id=2,
+            feature_name="team_register",
+        )
+
+        assert await FeatureChannelBase.is_enabled(1, 2, "team_register") is True
+        assert await FeatureChannelBase.is_enabled(1, 2, "team_register") is True
+        assert len(lookups) == 1
+
+        membership.is_enabled = False
+        await membership.save()
+
+        assert await FeatureChannelBase.is_enabled(1, 2, "team_register") is False
+        assert len(lookups) == 2
+        assert feature_enabled_cache.get((1, 2, "team_register")) is False
+
+        await membership.delete()
+
+        assert feature_enabled_cache.get((1, 2, "team_register")) is None
+    finally:
+        await asyncio.wait_for(close_db(db_url), timeout=3)
@@ -2989,7 +2989,7 @@ async def test_configured_feature_channel_context_missing_config_is_pure_lookup(
 
 
 @pytest.mark.asyncio
-async def test_is_enabled_uses_enabled_feature_channel_lookup(
+async def test_is_enabled_uses_enabled_feature_channel_exists_check(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     calls: list[tuple[int, int, str | None]] = []
@@ -2999,15 +2999,13 @@ async def test_is_enabled_uses_enabled_feature_channel_lookup(
         guild_id: int,
         channel_id: int,
         feature_name: str | None = None,
-    ) -> object | None:
+    ) -> bool:
         calls.append((guild_id, channel_id, feature_name))
-        if feature_name == "team_register":
-            return object()
-        return None
+        return feature_name == "team_register"
 
     monkeypatch.setattr(
         FeatureChannelBase,
-        "_get_enabled_feature_channel_or_none",
+        "_has_enabled_feature_channel",
         classmethod(fake_enabled_lookup),
     )
 
@@ -3030,13 +3028,13 @@ async def test_app_command_predicate_disabled_uses_interaction_locale(
         guild_id: int,
         channel_id: int,
         feature_name: str | None = None,
-    ) -> object | None:
+    ) -> bool:
         calls.append((guild_id, channel_id, feature_name))
-        return None
+        return False
 
     monkeypatch.setattr(
         FeatureChannelBase,
-        "_get_enabled_feature_channel_or_none",
+        "_has_enabled_feature_channel",
         classmethod(disabled_lookup),
     )
     predicate = FeatureChannelBase.feature_enabled_app_command_predicate(
@@ -3060,12 +3058,12 @@ async def test_app_command_wrapped_db_failure_sends_safe_check_error(
         _guild_id: int,
         _channel_id: int,
         _feature_name: str | None = None,
-    ) -> object | None:
+    ) -> bool:
         raise private_database_error()
 
     monkeypatch.setattr(
         FeatureChannelBase,
-        "_get_enabled_feature_channel_or_none",
+        "_has_enabled_feature_channel",
         classmethod(failing_lookup),
     )
     predicate = FeatureChannelBase.feature_enabled_app_command_predicate(
@@ -3108,13 +3106,13 @@ async def test_prefix_command_predicate_uses_lookup_key_and_display_error(
         guild_id: int,
         channel_id: int,
         feature_name: str | None = None,
-    ) -> object | None:
+    ) -> bool:
         calls.append((guild_id, channel_id, feature_name))
-        return None
+        return False
 
     monkeypatch.setattr(
         FeatureChannelBase,
-        "_get_enabled_feature_channel_or_none",
+        "_has_enabled_feature_channel",
         classmethod(disabled_lookup),
     )
     predicate = FeatureChannelBase.feature_enabled_prefix_command_predicate(
@@ -3138,12 +3136,12 @@ async def test_prefix_command_wrapped_db_failure_replies_safe_check_error(
         _guild_id: int,
         _channel_id: int,
         _feature_name: str | None = None,
-    ) -> object | None:
+    ) -> bool:
         raise private_database_error()
 
     monkeypatch.setattr(
         FeatureChannelBase,
-        "_get_enabled_feature_channel_or_none",
+        "_has_enabled_feature_channel",
         classmethod(failing_lookup),
     )
     predicate = FeatureChannelBase.feature_enabled_prefix_command_predicate(
@@ -3186,12 +3184,12 @@ async def test_prefix_command_storage_failure_logs_safe_fields(
         _guild_id: int,
         _channel_id: int,
         _feature_name: str | None = None,
-    ) -> object | None:
+    ) -> bool:
         raise private_database_error()
 
     monkeypatch.setattr(
         FeatureChannelBase,
-        "_get_enabled_feature_channel_or_none",
+        "_has_enabled_feature_channel",
         classmethod(failing_lookup),
     )
     predicate = FeatureChannelBase.feature_enabled_prefix_command_predicate(
@@ -3644,6 +3642,27 @@ async def test_message_processing_helper_ignores_bot_messages(
     assert feature_channel_context is None
 
 
+@pytest.mark.asyncio
+async def test_message_processing_helper_remembers_disabled_channels(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    lookups = 0
+
+    async def missing_membership(*_: object, **__: object) -> object | None:
+        nonlocal lookups
+        lookups += 1
+
+    monkeypatch.setattr(FeatureChannel, "get_or_none", missing_membership)
+    subject = RecordingMessageSubject(MessageParseResult.ignored())
+    get_message_context = (
+        MessageUpsertFeatureChannelBase._get_message_feature_channel_context_or_none
+    )
+
+    assert await get_message_context(subject, FakeRegisterMessage()) is None
+    assert await get_message_context(subject, FakeRegisterMessage()) is None
+    assert lookups == 1
+
+
 @pytest.mark.asyncio
 async def test_base_message_orchestration_ignored_skips_config_lookup(
     monkeypatch: pytest.MonkeyPatch,
@@ -5948,7 +5967,7 @@ async def test_public_register_guide_manual_anchor_save_failure_logs_warning(
 
 
 @pytest.mark.asyncio
-async def test_public_register_guide_saves_manual_anchor_before_later_send_failure(
+async def test_public_register_guide_saves_manual_anchor_despite_later_send_failure(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     monkeypatch.setattr(FeatureChannel, "get", fake_feature_channel_get)
@@ -6005,11 +6024,11 @@ async def test_public_register_guide_saves_manual_anchor_before_later_send_failu
     with pytest.raises(RuntimeError, match="second send failed"):
         await RegisterFeatureChannelBase.send_guide_message(subject, interaction)
 
-    assert events == [
+    assert [event for event in events if event[0] == "send"] == [
         ("send", "ja guide"),
-        ("save", 501),
         ("send", "en guide"),
     ]
+    assert [event for event in events if event[0] == "save"] == [("save", 501)]
 
 
 @pytest.mark.asyncio
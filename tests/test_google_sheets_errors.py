@@ -17,6 +17,7 @@ from utils.google_sheets import (
     GoogleSheet,
     GridValueUpdate,
     RhobotoGspreadClientManager,
+    _service_account_credentials,
 )
 from utils.google_sheets_errors import (
     GoogleSheetsError,
@@ -146,6 +147,35 @@ def test_google_sheet_uses_bounded_client_manager() -> None:
     assert isinstance(sheet._agcm, RhobotoGspreadClientManager)  # noqa: SLF001
 
 
+def test_google_sheets_share_parsed_credentials_per_service_account_path(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    loaded_paths: list[str] = []
+
+    def fake_from_service_account_file(
+        path: str,
+        **_kwargs: object,
+    ) -> SimpleNamespace:
+        loaded_paths.append(path)
+        return SimpleNamespace(path=path)
+
+    monkeypatch.setattr(
+        "utils.google_sheets.Credentials.from_service_account_file",
+        fake_from_service_account_file,
+    )
+    _service_account_credentials.cache_clear()
+    try:
+        first = GoogleSheet("https://sheet.example/1", "service.json")
+        second = GoogleSheet("https://sheet.example/2", "service.json")
+        other = GoogleSheet("https://sheet.example/3", "other.json")
+
+        assert first._get_creds() is second._get_creds()  # noqa: SLF001
+        assert other._get_creds() is not first._get_creds()  # noqa: SLF001
+        assert loaded_paths == ["service.json", "other.json"]
+    finally:
+        _service_account_credentials.cache_clear()
+
+
 @pytest.mark.asyncio
 async def test_gspread_client_manager_does_not_retry_quota_errors_forever() -> None:
     manager = RhobotoGspreadClientManager(object, gspread_delay=0)
@@ -39,6 +39,7 @@ def clear_message_template_caches() -> Iterator[None]:
         ("ja", "ja"),
         ("zh-TW", "zh_tw"),
         ("zh-CN", "zh_tw"),
+        ("", "en"),
     ],
 )
 def test_locale_to_template_code(locale: str, expected: str) -> None:
@@ -2,11 +2,15 @@ import asyncio
 import logging
 from contextlib import suppress
 from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 from tortoise import Tortoise
 
 SQLITE_KEEPALIVE_INTERVAL_SECONDS = 0.01
 SQLITE_OPERATION_TIMEOUT_SECONDS = 10.0
+POSTGRES_POOL_MINSIZE = 5
+POSTGRES_POOL_MAXSIZE = 20
+POSTGRES_SCHEMES = frozenset({"postgres", "postgresql", "asyncpg"})
 
 _sqlite_keepalive_task: asyncio.Task[None] | None = None
 
@@ -32,6 +36,17 @@ def _is_sqlite_url(db_url: str) -> bool:
     return db_url.startswith("sqlite://")
 
 
+def _with_pool_defaults(db_url: str) -> str:
+    """Add default asyncpg pool sizes unless the URL already sets them."""
+    parts = urlsplit(db_url)
+    if parts.scheme not in POSTGRES_SCHEMES:
+        return db_url
+    query = dict(parse_qsl(parts.query, keep_blank_values=True))
+    query.setdefault("minsize", str(POSTGRES_POOL_MINSIZE))
+    query.setdefault("maxsize", str(POSTGRES_POOL_MAXSIZE))
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
 async def _sqlite_keepalive_loop() -> None:
     # Intentionally tick the loop for aiosqlite thread-to-loop wakeups.
     while True:  # noqa: ASYNC110
@@ -77,7 +92,7 @@ async def init_db(db_url: str) -> None:
     await _start_sqlite_keepalive(db_url)
     try:
         await Tortoise.init(
-            db_url=db_url,
+            db_url=_with_pool_defaults(db_url),
             modules=get_model_modules(),
             _enable_global_fallback=True,
         )
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from tortoise.signals import post_delete, post_save
+
+from models.feature_channel import FeatureChannel
+
+if TYPE_CHECKING:
+    from tortoise.backends.base.client import BaseDBAsyncClient
+
+FEATURE_ENABLED_CACHE_TTL_SECONDS = 60.0
+
+type FeatureChannelKey = tuple[int, int, str]
+
+
+class FeatureEnabledCache:
+    """Short-lived cache of channel feature enabled states.
+
+    Entries expire after ``ttl`` seconds. Instance saves and deletes of
+    ``FeatureChannel`` invalidate their entry through Tortoise signals; code that
+    deletes memberships through a queryset must call ``invalidate`` itself.
+    """
+
+    def __init__(self, ttl: float = FEATURE_ENABLED_CACHE_TTL_SECONDS) -> None:
+        self.ttl = ttl
+        self._entries: dict[FeatureChannelKey, tuple[bool, float]] = {}
+
+    def get(self, key: FeatureChannelKey) -> bool | None:
+        """Return the cached enabled state, or ``None`` when missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        enabled, expires_at = entry
+        if time.monotonic() >= expires_at:
+            self._entries.pop(key, None)
+            return None
+        return enabled
+
+    def set(self, key: FeatureChannelKey, *, enabled: bool) -> None:
+        self._entries[key] = (enabled, time.monotonic() + self.ttl)
+
+    def invalidate(
+        self,
+        guild_id: int,
+        channel_id: int | None = None,
+        feature_name: str | None = None,
+    ) -> None:
+        """Drop guild entries matching the given channel and feature filters."""
+        if channel_id is not None and feature_name is not None:
+            self._entries.pop((guild_id, channel_id, feature_name), None)
+            return
+        for key in [
+            key
+            for key in self._entries
+            if key[0] == guild_id
+            and channel_id in {None, key[1]}
+            and feature_name in {None, key[2]}
+        ]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+feature_enabled_cache = FeatureEnabledCache()
+
+
+@post_save(FeatureChannel)
+async def _invalidate_saved_feature_channel(
+    _sender: type[FeatureChannel],
+    instance: FeatureChannel,
+    _created: bool,  # noqa: FBT001
+    _using_db: BaseDBAsyncClient | None,
+    _update_fields: list[str],
+) -> None:
+    _invalidate_instance(instance)
+
+
+@post_delete(FeatureChannel)
+async def _invalidate_deleted_feature_channel(
+    _sender: type[FeatureChannel],
+    instance: FeatureChannel,
+    _using_db: BaseDBAsyncClient | None,
+) -> None:
+    _invalidate_instance(instance)
+
+
+def _invalidate_instance(instance: FeatureChannel) -> None:
+    # A save may move a membership to another channel, so drop the feature's
+    # entries for the whole guild instead of only the current channel key.
+    feature_enabled_cache.invalidate(
+        instance.guild_id,
+        feature_name=instance.feature_name,
+    )
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import cache
 from operator import index
 from typing import TYPE_CHECKING, NoReturn
 
@@ -34,6 +35,7 @@ if TYPE_CHECKING:
     from requests import Response
 
 RGB_CHANNEL_MAX = 0xFF
+SPREADSHEETS_SCOPES = ("https://www.googleapis.com/auth/spreadsheets",)
 BORDER_NAMES = (
     "top",
     "bottom",
@@ -198,6 +200,16 @@ def _positive_integer(value: object, name: str) -> int:
     return integer
 
 
+@cache
+def _service_account_credentials(service_account_path: str) -> Credentials:
+    # Shared per path so the key file is parsed once and every client reuses the
+    # same refreshed access token instead of fetching its own.
+    return Credentials.from_service_account_file(
+        service_account_path,
+        scopes=SPREADSHEETS_SCOPES,
+    )
+
+
 class RhobotoGspreadClientManager(gspread_asyncio.AsyncioGspreadClientManager):
     async def handle_gspread_error(
         self,
@@ -737,14 +749,14 @@ class GoogleSheet:
         """
         Get Google API credentials from the service account file.
 
+        The parsed credentials are cached per service account path for the
+        process lifetime.
+
         Returns:
             Credentials: Google API credentials for spreadsheet access.
         """
         try:
-            return Credentials.from_service_account_file(
-                self.service_account_path,
-                scopes=["https://www.googleapis.com/auth/spreadsheets"],
-            )
+            return _service_account_credentials(self.service_account_path)
         except GoogleSheetsError:
             raise
         except GOOGLE_SHEETS_EXTERNAL_EXCEPTIONS as exc:
@@ -23,13 +23,12 @@ class MessageTemplateNotFoundError(FileNotFoundError):
         super().__init__(msg)
 
 
+_TEMPLATE_CODE_BY_LANGUAGE = {"zh": "zh_tw", "ja": "ja"}
+
+
 def locale_to_template_code(locale: str) -> str:
     """Map a Discord locale value to a message template locale code."""
-    if locale.startswith("zh"):
-        return "zh_tw"
-    if locale.startswith("ja"):
-        return "ja"
-    return "en"
+    return _TEMPLATE_CODE_BY_LANGUAGE.get(locale[:2], "en")
 
 
 def get_message_template_name(key: str, locale: str) -> str:
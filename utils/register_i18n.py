@@ -4,6 +4,8 @@ from typing import Final
 
 DEFAULT_LOCALE: Final = "en"
 
+_LOCALE_CODE_BY_LANGUAGE: Final[dict[str, str]] = {"zh": "zh_tw", "ja": "ja"}
+
 _FEATURE_LABELS: Final[dict[str, dict[str, str]]] = {
     "team_register": {
         "en": "Team Register",
@@ -122,11 +124,7 @@ def register_user_text(
 
 
 def _locale_code(locale: str) -> str:
-    if locale.startswith("zh"):
-        return "zh_tw"
-    if locale.startswith("ja"):
-        return "ja"
-    return DEFAULT_LOCALE
+    return _LOCALE_CODE_BY_LANGUAGE.get(locale[:2], DEFAULT_LOCALE)
 
 
 def _feature_label(